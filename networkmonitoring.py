@@ -1,14 +1,20 @@
+import asyncio
+import heapq
+import math
+import mmap
+import re
 import time
 import socket
+import struct
 import threading
 import os
 import ipaddress
-from collections import deque
+from array import array
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, List
+from itertools import compress
+from typing import Callable, Dict, Optional, List, Set, Tuple
 
-from ping3 import ping
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
@@ -17,69 +23,279 @@ from rich.layout import Layout
 from rich.text import Text
 from rich.align import Align
 HOSTS_FILE = "hosts.txt"
-MAX_THREADS = 50  
+MAX_THREADS = 50
 PING_INTERVAL = 1.0
+PING_TIMEOUT = 2.0
 HISTORY_SIZE = 10
+RENDER_INTERVAL = 0.25
+IDLE_REFRESH = 1.0
+
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+ICMP_PAYLOAD = b"\x00" * 56
+
+DNS_TTL = 300.0
+DNS_NEGATIVE_TTL = 30.0
+DNS_REFRESH = 5.0
+
+RDNS_TTL = 300.0
+RDNS_NEGATIVE_TTL = 30.0
+RDNS_CACHE_SIZE = 4096
+_RDNS_CACHE: Dict[str, Tuple[str, float]] = {}
+_RDNS_LOCK = threading.Lock()
+
+# One non-blank, non-comment line of hosts.txt, without surrounding whitespace.
+_HOST_LINE = re.compile(rb"(?m)^[ \t]*([^#\s][^\r\n]*?)[ \t]*\r?$")
+
+# Indexed by bool: [False] for down, [True] for up / any host down.
+_STATUS_CELL = ("[red]○ %s[/]", "[green]● %s[/]")
+_HEADER_STYLE = (("green", "white on black"), ("red", "white on red"))
 
 class HostResult:
     """Stores the monitoring results for a single host."""
-    def __init__(self, host: str, history_size: int = 10):
+    # Slots keep per-host state in fixed offsets instead of an instance dict.
+    __slots__ = (
+        "host", "idx", "response", "_hist", "_pos", "_count", "avg_latency",
+        "latency_change", "host_name", "success_rate", "test_count",
+        "last_update_ns", "jitter", "is_up", "last_latency", "_up_count",
+        "_samples", "_on_update", "status_cell", "latency_cell", "jitter_cell",
+        "success_cell",
+    )
+
+    def __init__(self, host: str, history_size: int = 10, idx: int = 0,
+                 on_update: Optional[Callable[["HostResult"], None]] = None):
         self.host = host
+        self.idx = idx
         self.response = "init..."
-        self.history = deque(maxlen=history_size)
+        # Fixed ring of float32 samples; NaN marks a timeout.
+        self._hist = array("f", [math.nan] * history_size)
+        self._pos = 0
+        self._count = 0
         self.avg_latency = 0.0
         self.latency_change = ""
         self.host_name = host 
         self.success_rate = 0.0
         self.test_count = 0
-        self.last_update = datetime.now()
+        self.last_update_ns = time.monotonic_ns()
         self.jitter = 0.0
         self.is_up = False
+        self.last_latency: Optional[float] = None
+        self._up_count = 0
+        self._samples = 0
+        self._on_update = on_update
+        self.format_cells()
+
+    @property
+    def last_update(self) -> datetime:
+        """Wall-clock time of the last update, derived on demand."""
+        age = (time.monotonic_ns() - self.last_update_ns) / 1e9
+        return datetime.fromtimestamp(time.time() - age)
 
-    def update(self, latency: Optional[float]):
+    def update(self, latency: Optional[float], error: str = "timeout"):
         self.test_count += 1
-        self.last_update = datetime.now()
+        self.last_update_ns = time.monotonic_ns()
+
+        # The oldest sample is overwritten once the ring is full.
+        hist, pos, count, up_count = self._hist, self._pos, self._count, self._up_count
+        size = len(hist)
+        if count == size:
+            if not math.isnan(hist[pos]):
+                up_count -= 1
+        else:
+            count += 1
+        self._pos = pos + 1 if pos + 1 < size else 0
 
         if latency is None:
-            self.response = "timeout"
-            self.history.append(None)
+            self.response = error
+            hist[pos] = math.nan
             self.is_up = False
+            if not up_count:
+                self.avg_latency = 0.0
+                self.jitter = 0.0
+                self.latency_change = "-"
+                self.last_latency = None
+                self._samples = 0
         else:
             latency_ms = latency * 1000
-            self.response = f"{latency_ms:.2f} ms"
-            self.history.append(latency_ms)
+            self.response = "%.2f ms" % latency_ms
+            hist[pos] = latency_ms
             self.is_up = True
+            up_count += 1
+            self._add_sample(latency_ms)
 
-        self.calculate_metrics()
-
-    def calculate_metrics(self):
-        non_none_history = [lat for lat in self.history if lat is not None]
-
-        if non_none_history:
-            new_avg = sum(non_none_history) / len(non_none_history)
-            if self.avg_latency:
-                if new_avg > self.avg_latency:
-                    self.latency_change = "[red]↑[/]"
-                elif new_avg < self.avg_latency:
-                    self.latency_change = "[green]↓[/]"
-                else:
-                    self.latency_change = "-"
-            self.avg_latency = new_avg
-            self.jitter = max(non_none_history) - min(non_none_history)
-            self.success_rate = (len(non_none_history) / len(self.history)) * 100
-        else:
-            self.avg_latency = 0.0
-            self.jitter = 0.0
-            self.success_rate = 0.0
-            self.latency_change = "-"
+        self._count, self._up_count = count, up_count
+        self.success_rate = (up_count / count) * 100
+        self.format_cells()
+        if self._on_update:
+            self._on_update(self)
+
+    def format_cells(self):
+        """Renders the table cells once per update so redraws only copy strings."""
+        self.status_cell = _STATUS_CELL[self.is_up] % self.response
+        self.latency_cell = "%.1fms %s" % (self.avg_latency, self.latency_change)
+        self.jitter_cell = "%.1fms" % self.jitter
+        self.success_cell = "%.0f%%" % self.success_rate
+
+    def _add_sample(self, latency_ms: float):
+        """Folds one reply into the running mean and RFC 1889 jitter estimate."""
+        if self.last_latency is not None:
+            self.jitter += (abs(latency_ms - self.last_latency) - self.jitter) / 16
+        self.last_latency = latency_ms
+
+        self._samples = min(self._samples + 1, len(self._hist))
+        new_avg = self.avg_latency + (latency_ms - self.avg_latency) / self._samples
+        if self.avg_latency:
+            if new_avg > self.avg_latency:
+                self.latency_change = "[red]↑[/]"
+            elif new_avg < self.avg_latency:
+                self.latency_change = "[green]↓[/]"
+            else:
+                self.latency_change = "-"
+        self.avg_latency = new_avg
+
+def _checksum(data) -> int:
+    """Internet checksum (RFC 1071) of an ICMP packet, in host byte order.
+
+    The one's complement sum is byte-order independent, so the words are summed
+    natively straight off the buffer; store the result with ``"=H"``.
+    """
+    if len(data) % 2:
+        data = bytes(data) + b"\x00"
+    total = sum(memoryview(data).cast("H"))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def _icmp_socket() -> socket.socket:
+    """Opens a raw ICMP socket, falling back to an unprivileged datagram one.
+
+    Raw sockets need root or CAP_NET_RAW (administrator on Windows); datagram
+    ICMP sockets work on Linux for any user in net.ipv4.ping_group_range.
+    macOS also offers them unprivileged, but that path is untested.
+    """
+    try:
+        return socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+    except PermissionError as e:
+        try:
+            return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        except OSError:
+            raise e
+
+class RawIcmpPinger:
+    """Pings every host over a single raw ICMP socket from one asyncio loop."""
+    def __init__(self, results: Dict[str, HostResult], addrs: Dict[str, Optional[str]]):
+        self.results = results
+        self.addrs = addrs
+        # Raises PermissionError when neither socket kind is allowed.
+        self.sock = _icmp_socket()
+        self.sock.setblocking(False)
+        self.raw = self.sock.type == socket.SOCK_RAW
+        self.ident = os.getpid() & 0xFFFF
+        self.seq = 0
+        self.pending: Dict[Tuple[int, int], Tuple[str, float]] = {}
+        # One reusable echo request per host; only seq and checksum change per send.
+        self.packets: Dict[str, bytearray] = {}
+
+    def _packet(self, host: str, seq: int) -> bytearray:
+        pkt = self.packets.get(host)
+        if pkt is None:
+            pkt = bytearray(struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, self.ident, 0) + ICMP_PAYLOAD)
+            self.packets[host] = pkt
+        struct.pack_into("!HHH", pkt, 2, 0, self.ident, seq)
+        struct.pack_into("=H", pkt, 2, _checksum(pkt))
+        return pkt
+
+    def _send_all(self):
+        for host, result in self.results.items():
+            if host not in self.addrs:
+                continue  # First lookup still in flight.
+            ip = self.addrs[host]
+            if ip is None:
+                result.update(None, "DNS ERR")
+                continue
+            self.seq = (self.seq + 1) & 0xFFFF
+            try:
+                self.sock.sendto(self._packet(host, self.seq), (ip, 0))
+            except OSError:
+                result.update(None)
+                continue
+            self.pending[(self.ident, self.seq)] = (host, time.monotonic())
+
+    def _drain(self):
+        """Reads every queued reply for one readiness event, until EAGAIN."""
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(1500)
+            except (BlockingIOError, InterruptedError):
+                return  # Queue is empty.
+            except OSError:
+                # Datagram ping sockets report ICMP errors (e.g. host unreachable)
+                # for an earlier echo here. Reading it clears the error; the probe
+                # expires as a timeout, and the level-triggered reader calls us
+                # again if replies are still queued.
+                return
+            self._handle_reply(data, time.monotonic())
+
+    def _handle_reply(self, data: bytes, now: float):
+        # Raw sockets deliver the IPv4 header; Linux datagram sockets do not.
+        # Detect it from the version nibble rather than assume either way.
+        ihl = (data[0] & 0x0F) * 4 if data[0] >> 4 == 4 else 0
+        if len(data) < ihl + 8:
+            return
+        icmp_type, _, _, ident, seq = struct.unpack_from("!BBHHH", data, ihl)
+        if icmp_type != ICMP_ECHO_REPLY:
+            return
+        if not self.raw:
+            # Linux rewrites the identifier of datagram pings to the socket's port,
+            # so match on sequence alone. Untested on macOS datagram sockets.
+            ident = self.ident
+        entry = self.pending.pop((ident, seq), None)
+        if entry is not None:
+            host, sent = entry
+            self.results[host].update(now - sent)
+
+    def _expire(self):
+        now = time.monotonic()
+        for key, (host, sent) in list(self.pending.items()):
+            if now - sent >= PING_TIMEOUT:
+                del self.pending[key]
+                self.results[host].update(None)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        # Replies are matched as they arrive; the loop only paces the send rounds.
+        # Needs a selector loop: epoll on Linux, kqueue on BSD/macOS, select on Windows.
+        loop.add_reader(self.sock.fileno(), self._drain)
+        try:
+            while True:
+                started = loop.time()
+                self._send_all()
+                await asyncio.sleep(max(0.0, PING_INTERVAL - (loop.time() - started)))
+                self._expire()
+        finally:
+            loop.remove_reader(self.sock.fileno())
 
 class NetworkMonitor:
     def __init__(self):
         self.results: Dict[str, HostResult] = {}
+        # host -> IPv4 address, or None after a failed lookup; written by the resolver pool.
+        self.addrs: Dict[str, Optional[str]] = {}
+        self._addr_expires: Dict[str, float] = {}
+        self.dirty: Set[str] = set()
+        self._dirty_lock = threading.Lock()
+        self._hosts_order: List[str] = []
+        self._is_up = bytearray(0)
+        self._latest = array("f")
+        self._row_sigs: List[int] = []
+        self._sig = 0
+        self._last_sig: Optional[int] = None
+        self._dirty_evt = threading.Event()
+        self._last_render = 0.0
         self.console = Console()
         self.layout = Layout()
         self._ensure_hosts_file()
         self._load_hosts()
+        self._table = self._build_table()
 
     def _ensure_hosts_file(self):
         """Creates a dummy hosts.txt if it doesn't exist."""
@@ -90,19 +306,36 @@ class NetworkMonitor:
 
     def _load_hosts(self):
         try:
-            with open(HOSTS_FILE, "r") as file:
-                raw_hosts = [line.strip() for line in file if line.strip() and not line.startswith("#")]
-            
             cleaned_hosts = []
-            for h in raw_hosts:
-                h = h.replace("https://", "").replace("http://", "")
-                h = h.split("/")[0]
-                cleaned_hosts.append(h)
+            with open(HOSTS_FILE, "rb") as file:
+                if os.fstat(file.fileno()).st_size:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        for match in _HOST_LINE.finditer(mm):
+                            h = match.group(1)
+                            if h.startswith((b"http://", b"https://")):
+                                h = h.split(b"://", 1)[1].split(b"/", 1)[0]
+                            else:
+                                # Drop URL paths but keep CIDR prefixes like /24.
+                                base, _, suffix = h.partition(b"/")
+                                if not suffix.isdigit():
+                                    h = base
+                            cleaned_hosts.append(h.decode())
 
             expanded_hosts = self._expand_hosts(cleaned_hosts)
             for host in expanded_hosts:
                 if host not in self.results:
-                    self.results[host] = HostResult(host, HISTORY_SIZE)
+                    self.results[host] = HostResult(host, HISTORY_SIZE, len(self.results), self._on_result)
+                # IP literals can be pinged at once; names are left to the resolver pool.
+                try:
+                    ipaddress.IPv4Address(host)
+                except ValueError:
+                    continue
+                self.addrs[host] = host
+                self._addr_expires[host] = math.inf
+            self._hosts_order = list(self.results)
+            self._is_up = bytearray(len(self._hosts_order))
+            self._latest = array("f", bytes(4 * len(self._hosts_order)))
+            self._row_sigs = [0] * len(self._hosts_order)
             self.console.print(f"[green]Loaded {len(self.results)} hosts.[/]")
         except Exception as e:
             self.console.print(f"[bold red]Error loading hosts:[/] {e}")
@@ -116,7 +349,11 @@ class NetworkMonitor:
                     if network.num_addresses > 256:
                          self.console.print(f"[yellow]Skipping {host}: Too many IPs ({network.num_addresses}). Split into smaller chunks.[/]")
                          continue
-                    expanded.extend([str(ip) for ip in network.hosts()])
+                    base = int(network.network_address)
+                    n = network.num_addresses
+                    # /31 and /32 have no network/broadcast addresses to skip.
+                    first, last = (0, n) if n <= 2 else (1, n - 1)
+                    expanded.extend(socket.inet_ntoa(struct.pack("!I", base + i)) for i in range(first, last))
                 except ValueError:
                     self.console.print(f"[yellow]Invalid CIDR: {host}[/]")
             elif '-' in host: 
@@ -127,10 +364,8 @@ class NetworkMonitor:
                     if int(end_ip) - int(start_ip) > 256:
                         self.console.print(f"[yellow]Skipping range {host}: Too many IPs.[/]")
                         continue
-                    current = start_ip
-                    while current <= end_ip:
-                        expanded.append(str(current))
-                        current += 1
+                    for i in range(int(start_ip), int(end_ip) + 1):
+                        expanded.append(socket.inet_ntoa(struct.pack("!I", i)))
                 except ValueError:
                     self.console.print(f"[yellow]Invalid Range: {host}[/]")
             else:
@@ -139,61 +374,133 @@ class NetworkMonitor:
 
     def _resolve_hostname(self, host: str) -> str:
         try:
-            return socket.gethostbyaddr(host)[0]
-        except socket.herror:
-            return host
+            ipaddress.ip_address(host)
+        except ValueError:
+            return host  # Already a hostname; a PTR lookup would not improve it.
 
-    def _ping_host(self, host: str):
-        host_result = self.results[host]
-        host_result.host_name = self._resolve_hostname(host)
+        now = time.monotonic()
+        entry = _RDNS_CACHE.get(host)
+        if entry:
+            name, expires = entry
+            if now < expires:
+                return name
+        try:
+            name, ttl = socket.gethostbyaddr(host)[0], RDNS_TTL
+        except (socket.herror, socket.gaierror):
+            name, ttl = host, RDNS_NEGATIVE_TTL
+        with _RDNS_LOCK:
+            if len(_RDNS_CACHE) >= RDNS_CACHE_SIZE and host not in _RDNS_CACHE:
+                del _RDNS_CACHE[next(iter(_RDNS_CACHE))]
+            _RDNS_CACHE[host] = (name, now + ttl)
+        return name
 
-        while True:
-            try:
-                latency = ping(host, timeout=2)
-            except PermissionError:
-                host_result.response = "PERM ERR"
-                time.sleep(5)
-                continue
-            except Exception:
-                latency = None
-            
-            host_result.update(latency)
-            time.sleep(PING_INTERVAL)
+    def _resolve_addr(self, host: str):
+        now = time.monotonic()
+        try:
+            ip, ttl = socket.gethostbyname(host), DNS_TTL
+        except (socket.gaierror, UnicodeError):
+            ip, ttl = None, DNS_NEGATIVE_TTL
+        self.addrs[host] = ip
+        self._addr_expires[host] = now + ttl
 
-    def _start_pinging(self):
-        hosts = list(self.results.keys())
-        workers = min(len(hosts), MAX_THREADS)
-        
+    def _resolve_once(self, host: str):
+        if time.monotonic() >= self._addr_expires.get(host, 0.0):
+            self._resolve_addr(host)
+        result = self.results[host]
+        host_name = self._resolve_hostname(host)
+        if host_name != result.host_name:
+            result.host_name = host_name
+            self._mark_dirty(result)
+
+    def _resolve_hostnames(self):
+        # One short task per host, so a slow lookup never holds back the rest.
+        # Each pass only hits the resolver for entries whose TTL has run out.
+        workers = min(len(self._hosts_order), MAX_THREADS)
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            for host in hosts:
-                executor.submit(self._ping_host, host)
+            while True:
+                list(executor.map(self._resolve_once, self._hosts_order))
+                time.sleep(DNS_REFRESH)
+
+    def _on_result(self, result: HostResult):
+        self._is_up[result.idx] = result.is_up
+        if result.is_up:
+            self._latest[result.idx] = result.last_latency
+        self._mark_dirty(result)
+
+    def _mark_dirty(self, result: HostResult):
+        sig = hash((result.host_name, result.status_cell, result.latency_cell,
+                    result.jitter_cell, result.success_cell))
+        with self._dirty_lock:
+            # XOR of every row's signature, swapped one row at a time.
+            self._sig ^= self._row_sigs[result.idx] ^ sig
+            self._row_sigs[result.idx] = sig
+            self.dirty.add(result.host)
+        self._dirty_evt.set()
+
+    def _mark_all(self, response: str):
+        """Shows the same error on every host, e.g. when pinging cannot run."""
+        for result in self.results.values():
+            result.response = response
+            result.is_up = False
+            self._is_up[result.idx] = False
+            result.format_cells()
+            self._mark_dirty(result)
+
+    def _start_pinging(self):
+        try:
+            pinger = RawIcmpPinger(self.results, self.addrs)
+        except PermissionError:
+            self._mark_all("PERM ERR")
+            return
+        # Not asyncio.run(): Windows defaults to the proactor loop, which has no add_reader.
+        loop = asyncio.SelectorEventLoop()
+        try:
+            loop.run_until_complete(pinger.run())
+        except Exception:
+            # This thread sits behind the full-screen UI; surface the failure there.
+            self._mark_all("PING ERR")
+        finally:
+            loop.close()
 
     def _generate_header(self) -> Panel:
         """Generates the statistics header."""
-        total = len(self.results)
-        up = sum(1 for h in self.results.values() if h.is_up)
+        total = len(self._is_up)
+        up = self._is_up.count(1)
         down = total - up
-        status_color = "green" if down == 0 else "red"
+        status_color, panel_style = _HEADER_STYLE[down > 0]
+
+        # Latest latency of every online host, filtered by the up-bytes in C.
+        alive = list(compress(self._latest, self._is_up))
+        if alive:
+            fleet_avg = f"{sum(alive) / len(alive):.1f}ms"
+            p99 = f"{heapq.nlargest(max(1, len(alive) // 100), alive)[-1]:.1f}ms"
+        else:
+            fleet_avg = p99 = "-"
         
         grid = Table.grid(expand=True)
         grid.add_column(justify="center", ratio=1)
         grid.add_column(justify="center", ratio=1)
         grid.add_column(justify="center", ratio=1)
+        grid.add_column(justify="center", ratio=1)
+        grid.add_column(justify="center", ratio=1)
         
         grid.add_row(
             f"[bold]Total Hosts:[/]\n{total}",
             f"[bold green]Online:[/]\n{up}",
-            f"[bold red]Offline:[/]\n{down}"
+            f"[bold red]Offline:[/]\n{down}",
+            f"[bold]Avg Latency:[/]\n{fleet_avg}",
+            f"[bold]p99 Latency:[/]\n{p99}"
         )
         return Panel(
             grid, 
-            style=f"white on {status_color}" if down > 0 else "white on black", 
+            style=panel_style, 
             title="[bold]Network Status Monitor[/]", 
             subtitle="[bold cyan]Dev: Rayane/Erwxn[/]",
             border_style=status_color
         )
 
-    def _generate_table(self) -> Table:
+    def _build_table(self) -> Table:
+        """Creates the metrics table once, with one row per host in load order."""
         table = Table(show_header=True, header_style="bold magenta", expand=True)
         table.add_column("Host", style="cyan")
         table.add_column("Hostname", style="dim white")
@@ -201,41 +508,70 @@ class NetworkMonitor:
         table.add_column("Latency", justify="right")
         table.add_column("Jitter", justify="right")
         table.add_column("Success %", justify="right")
-        
+
         for host, result in self.results.items():
-            status_style = "green" if result.is_up else "red"
-            status_icon = "●" if result.is_up else "○"
-            
-            table.add_row(
-                host,
-                result.host_name,
-                f"[{status_style}]{status_icon} {result.response}[/]",
-                f"{result.avg_latency:.1f}ms {result.latency_change}",
-                f"{result.jitter:.1f}ms",
-                f"{result.success_rate:.0f}%"
-            )
+            table.add_row(*self._row_cells(host, result))
         return table
 
+    def _row_cells(self, host: str, result: HostResult) -> Tuple[str, ...]:
+        return (
+            host,
+            result.host_name,
+            result.status_cell,
+            result.latency_cell,
+            result.jitter_cell,
+            result.success_cell
+        )
+
+    def _refresh_table(self) -> Table:
+        """Rewrites only the rows of hosts that changed since the last frame."""
+        with self._dirty_lock:
+            dirty, self.dirty = self.dirty, set()
+
+        columns = self._table.columns
+        for host in dirty:
+            result = self.results[host]
+            for column, cell in zip(columns, self._row_cells(host, result)):
+                column._cells[result.idx] = cell
+        return self._table
+
     def run(self):
         if not self.results:
             self.console.print("[bold red]No hosts found to monitor.[/]")
             return
 
+        threading.Thread(target=self._resolve_hostnames, daemon=True).start()
         threading.Thread(target=self._start_pinging, daemon=True).start()
         self.layout.split(
             Layout(name="header", size=5),
             Layout(name="body")
         )
 
-        with Live(self.layout, refresh_per_second=4, screen=True) as live:
+        with Live(self.layout, auto_refresh=False, screen=True) as live:
             while True:
+                # Wake on the first result, but never redraw faster than RENDER_INTERVAL.
+                self._dirty_evt.wait(timeout=IDLE_REFRESH)
+                self._dirty_evt.clear()
+                elapsed = time.monotonic() - self._last_render
+                if elapsed < RENDER_INTERVAL:
+                    time.sleep(RENDER_INTERVAL - elapsed)
+
+                # Nothing visible changed since the last frame; skip the redraw.
+                sig = self._sig
+                if sig == self._last_sig:
+                    continue
+                self._last_sig = sig
+
                 self.layout["header"].update(self._generate_header())
-                self.layout["body"].update(Panel(self._generate_table(), title="Live Metrics", border_style="blue"))
-                time.sleep(0.25)
+                self.layout["body"].update(Panel(self._refresh_table(), title="Live Metrics", border_style="blue"))
+                live.refresh()
+                self._last_render = time.monotonic()
 
 if __name__ == "__main__":
-    if os.name != 'nt' and os.geteuid() != 0:
-        print("\033[91mError: ICMP pings require root privileges. Run with sudo.\033[0m")
+    try:
+        _icmp_socket().close()
+    except PermissionError:
+        print("\033[91mError: ICMP pings require root, CAP_NET_RAW or net.ipv4.ping_group_range. Run with sudo.\033[0m")
         exit(1)
         
     try: